@@ -5,9 +5,72 @@ A Streamlit-based conversational interface for interacting with the
 DeepSeek-V3 language model through Azure AI Inference services.
 """
 
+import functools
+import os
+from typing import Optional
+
 __version__ = "0.1.0"
 __author__ = "Your Name"
 
 # Configuration
+# Default inference endpoint; DEEPSEEK_ENDPOINT overrides it (see get_endpoint)
 ENDPOINT = "https://models.inference.ai.azure.com"
 MODEL_NAME = "DeepSeek-V3"
+
+# HTTP transport timeouts in seconds; reads stay long so slow streams survive
+CONNECTION_TIMEOUT = 5
+READ_TIMEOUT = 300
+
+# Retries for failed requests; kept low so a stalled call fails fast
+RETRY_TOTAL = 2
+
+# HTTP connection pool: hosts kept pooled (default 8) and connections per host
+POOL_CONNECTIONS = 8
+POOL_MAXSIZE = 32
+
+# Minimum seconds between re-renders of a streaming response
+STREAM_FLUSH_INTERVAL = 0.05
+
+# Longest received text may wait for a streaming chunk to fill before it is shown
+STREAM_MAX_HOLD = 0.25
+
+# Responses kept for get_response(cache=True), one per identical request
+RESPONSE_CACHE_SIZE = 128
+
+
+@functools.lru_cache(maxsize=1)
+def load_env() -> bool:
+    """
+    Load environment variables from a .env file, once per process.
+
+    Returns:
+        bool: True if a .env file was found and loaded
+    """
+    from dotenv import load_dotenv
+
+    return load_dotenv()
+
+
+def get_endpoint() -> str:
+    """
+    Get the inference endpoint to connect to.
+
+    The environment is read on each call rather than at import, so a
+    DEEPSEEK_ENDPOINT loaded from .env by load_env() is honoured.
+
+    Returns:
+        str: DEEPSEEK_ENDPOINT if set, otherwise ENDPOINT
+    """
+    return os.environ.get("DEEPSEEK_ENDPOINT") or ENDPOINT
+
+
+def get_token_from_env() -> Optional[str]:
+    """
+    Get authentication token from environment variables.
+
+    Checks for GITHUB_TOKEN or AZURE_KEY environment variables.
+
+    Returns:
+        Optional[str]: The token if found, None otherwise
+    """
+    return os.environ.get("GITHUB_TOKEN") or os.environ.get("AZURE_KEY") or None
@@ -8,13 +8,35 @@ the DeepSeek-V3 language model through Azure AI Inference SDK.
 import os
 
 import streamlit as st
-from azure.ai.inference.models import AssistantMessage, UserMessage
-from dotenv import load_dotenv
 
-from deepseek_chatbot.core import DeepSeekChatbot, get_token_from_env
+from deepseek_chatbot import load_env
+from deepseek_chatbot.core import DeepSeekChatbot, get_token_from_env, token_gen
 
 # Load environment variables from .env file
-load_dotenv()
+load_env()
+
+# Prompts shorter than this many characters are always streamed
+SHORT_PROMPT_LENGTH = 32
+
+# Seconds to wait on a stalled response before failing the request
+REQUEST_TIMEOUT = 90
+
+
+@st.cache_resource(show_spinner=False)
+def get_chatbot(token: str) -> DeepSeekChatbot:
+    """
+    Get a DeepSeek chatbot for the given token, shared across reruns.
+
+    Streamlit re-executes the script on every interaction, so caching the
+    chatbot keeps its client and connection pool alive between reruns.
+
+    Args:
+        token (str): GitHub token or Azure key for authentication
+
+    Returns:
+        DeepSeekChatbot: The cached chatbot for this token
+    """
+    return DeepSeekChatbot(token)
 
 
 def init_session_state() -> None:
@@ -45,42 +67,48 @@ def main() -> None:
             st.session_state.authenticated = True
             st.session_state.token = env_token
 
+        # Placeholder lets a disconnect swap in the login form without a rerun
+        auth_section = st.empty()
+
+        if st.session_state.authenticated:
+            with auth_section.container():
+                st.success("Authenticated ✅")
+                if st.button("Disconnect"):
+                    st.session_state.authenticated = False
+                    if "token" in st.session_state:
+                        del st.session_state.token
+
         if not st.session_state.authenticated:
-            auth_option = st.radio(
-                "Select authentication method", options=["GitHub Token", "Azure Key"]
-            )
-
-            if auth_option == "GitHub Token":
-                token = st.text_input(
-                    "Enter your GitHub token",
-                    type="password",
-                    help="Your GitHub token needs models:read permissions",
+            with auth_section.container():
+                auth_option = st.radio(
+                    "Select authentication method",
+                    options=["GitHub Token", "Azure Key"],
                 )
-                st.markdown(
-                    "Learn how to [create a GitHub token]"
-                    "(https://docs.github.com/en/authentication/keeping-your-account-and-data-secure/"
-                    "managing-your-personal-access-tokens)"
-                )
-            else:
-                token = st.text_input("Enter your Azure key", type="password")
-
-            if st.button("Connect to DeepSeek"):
-                if token:
-                    # Set the token in environment variable
-                    os.environ["GITHUB_TOKEN"] = token
-                    st.session_state.authenticated = True
-                    st.session_state.token = token
-                    st.success("Authentication successful!")
-                    st.experimental_rerun()
+
+                if auth_option == "GitHub Token":
+                    token = st.text_input(
+                        "Enter your GitHub token",
+                        type="password",
+                        help="Your GitHub token needs models:read permissions",
+                    )
+                    st.markdown(
+                        "Learn how to [create a GitHub token]"
+                        "(https://docs.github.com/en/authentication/keeping-your-account-and-data-secure/"
+                        "managing-your-personal-access-tokens)"
+                    )
                 else:
-                    st.error("Please enter a valid token")
-        else:
-            st.success("Authenticated ✅")
-            if st.button("Disconnect"):
-                st.session_state.authenticated = False
-                if "token" in st.session_state:
-                    del st.session_state.token
-                st.experimental_rerun()
+                    token = st.text_input("Enter your Azure key", type="password")
+
+                if st.button("Connect to DeepSeek"):
+                    if token:
+                        # Set the token in environment variable
+                        os.environ["GITHUB_TOKEN"] = token
+                        st.session_state.authenticated = True
+                        st.session_state.token = token
+                        st.success("Authentication successful!")
+                        st.rerun()
+                    else:
+                        st.error("Please enter a valid token")
 
         st.header("Settings")
         max_tokens = st.slider(
@@ -91,7 +119,20 @@ def main() -> None:
             help="Maximum number of tokens in the model's response",
         )
 
-        streaming_enabled = st.checkbox("Stream response", value=True)
+        streaming_enabled = st.checkbox(
+            "Stream response",
+            value=True,
+            help=f"Prompts shorter than {SHORT_PROMPT_LENGTH} characters are "
+            "always streamed",
+        )
+        stream_chunk_size = st.slider(
+            "Streaming chunk size",
+            min_value=1,
+            max_value=50,
+            value=1,
+            help="Minimum number of streamed tokens to group into each update; "
+            "raise it on slow connections for fewer, larger updates",
+        )
 
         st.header("About")
         st.markdown(
@@ -104,14 +145,14 @@ def main() -> None:
 
     # Chat interface
     if st.session_state.authenticated:
-        chatbot = DeepSeekChatbot(st.session_state.token)
+        chatbot = get_chatbot(st.session_state.token)
 
-        # Display chat messages
-        for message in st.session_state.messages:
-            role = message["role"]
-            content = message["content"]
-            with st.chat_message(role):
-                st.write(content)
+        # Committed history lives in its own container, apart from the turn
+        # that is currently streaming below it
+        with st.container():
+            for message in st.session_state.messages:
+                with st.chat_message(message["role"]):
+                    st.markdown(message["content"])
 
         # Chat input
         user_input = st.chat_input("Type your message here...")
@@ -124,43 +165,28 @@ def main() -> None:
             with st.chat_message("user"):
                 st.write(user_input)
 
-            # Prepare messages for the API
-            api_messages = []
-            for msg in st.session_state.messages:
-                if msg["role"] == "user":
-                    api_messages.append(UserMessage(msg["content"]))
-                elif msg["role"] == "assistant":
-                    api_messages.append(AssistantMessage(msg["content"]))
+            # Chat history is already in the dict format the SDK accepts
+            api_messages = st.session_state.messages
 
             # Get model response (with spinner)
             with st.spinner("DeepSeek is thinking..."):
                 with st.chat_message("assistant"):
-                    response_container = st.empty()
-
-                    if streaming_enabled:
+                    # Short prompts always stream so the first tokens show at once
+                    if streaming_enabled or len(user_input) < SHORT_PROMPT_LENGTH:
                         # Stream the response
-                        full_response = ""
                         response = chatbot.get_response(
-                            api_messages, stream=True, max_tokens=max_tokens
+                            api_messages,
+                            stream=True,
+                            max_tokens=max_tokens,
+                            request_timeout=REQUEST_TIMEOUT,
                         )
                         if response is not None:  # Check if response exists
                             try:
-                                for chunk in response:
-                                    # Safely check for attributes
-                                    content = ""
-                                    if (
-                                        hasattr(chunk, "choices")
-                                        and chunk.choices
-                                        and hasattr(chunk.choices[0], "delta")
-                                        and chunk.choices[0].delta is not None
-                                        and hasattr(chunk.choices[0].delta, "content")
-                                    ):
-                                        content = chunk.choices[0].delta.content or ""
-
-                                    full_response += content
-                                    response_container.write(full_response)
-
-                                final_response = full_response
+                                final_response = str(
+                                    st.write_stream(
+                                        token_gen(response, stream_chunk_size)
+                                    )
+                                )
                             except Exception as e:
                                 st.error(f"Error streaming response: {str(e)}")
                                 final_response = (
@@ -168,30 +194,22 @@ def main() -> None:
                                 )
                         else:
                             final_response = "Error getting response from the model."
-                            response_container.error(final_response)
+                            st.error(final_response)
                     else:
                         # Get complete response
                         response = chatbot.get_response(
-                            api_messages, stream=False, max_tokens=max_tokens
+                            api_messages,
+                            stream=False,
+                            max_tokens=max_tokens,
+                            request_timeout=REQUEST_TIMEOUT,
                         )
-                        if response is not None:
-                            if (
-                                hasattr(response, "choices")
-                                and response.choices
-                                and hasattr(response.choices[0], "message")
-                                and response.choices[0].message
-                                and hasattr(response.choices[0].message, "content")
-                            ):
-                                final_response = response.choices[0].message.content
-                                response_container.write(final_response)
-                            else:
-                                final_response = (
-                                    "Error getting response from the model."
-                                )
-                                response_container.error(final_response)
-                        else:
+                        try:
+                            final_response = response.choices[0].message.content  # type: ignore[union-attr]
+                        except (AttributeError, IndexError, TypeError):
                             final_response = "Error getting response from the model."
-                            response_container.error(final_response)
+                            st.error(final_response)
+                        else:
+                            st.write(final_response)
 
                     # Add assistant response to chat history
                     st.session_state.messages.append(
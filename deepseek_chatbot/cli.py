@@ -7,26 +7,86 @@ DeepSeek-V3 language model through Azure AI Inference SDK.
 
 import sys
 import argparse
-from typing import Optional
-from dotenv import load_dotenv
+import asyncio
+import threading
+import time
+from typing import Awaitable, List, Optional
 from azure.ai.inference.models import UserMessage
 
-from deepseek_chatbot.core import DeepSeekChatbot, get_token_from_env
+from deepseek_chatbot import load_env
+from deepseek_chatbot.core import (
+    DeepSeekChatbot,
+    aiter_deltas,
+    get_token_from_env,
+)
 
 # Load environment variables from .env file
-load_dotenv()
+load_env()
 
+# Minimum seconds between stdout flushes while streaming (about one frame)
+STDOUT_FLUSH_INTERVAL = 0.016
 
-def query_deepseek(prompt: str, stream: bool = False) -> Optional[str]:
+# Buffered characters that force a flush regardless of the interval
+STDOUT_BUFFER_SIZE = 4096
+
+
+class StreamPrinter:
     """
-    Send a query to the DeepSeek-V3 model and get a response.
+    Write streamed text to stdout in batches.
 
-    Args:
-        prompt: The user's prompt or question
-        stream: Whether to stream the response
+    Text is buffered and flushed at most once per STDOUT_FLUSH_INTERVAL, or
+    once STDOUT_BUFFER_SIZE characters are pending, so a fast stream does not
+    cost a write syscall per token. On an event loop, text held back by the
+    interval is flushed when the interval ends, even if no more text arrives;
+    otherwise it is flushed by the next write() or the final flush().
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty buffer."""
+        self.buffer: List[str] = []
+        self.size = 0
+        self.last_flush = time.monotonic()
+        self.stream = sys.stdout
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+    def write(self, text: str) -> None:
+        """
+        Buffer text, flushing if the flush interval has elapsed.
+
+        Args:
+            text: The text to write
+        """
+        self.buffer.append(text)
+        self.size += len(text)
+        elapsed = time.monotonic() - self.last_flush
+        if self.size >= STDOUT_BUFFER_SIZE or elapsed >= STDOUT_FLUSH_INTERVAL:
+            self.flush()
+        elif self.timer is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            self.timer = loop.call_later(STDOUT_FLUSH_INTERVAL - elapsed, self.flush)
+
+    def flush(self) -> None:
+        """Write any buffered text to stdout and flush it."""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        if self.buffer:
+            self.stream.write("".join(self.buffer))
+            self.buffer = []
+            self.size = 0
+        self.stream.flush()
+        self.last_flush = time.monotonic()
+
+
+def create_chatbot() -> DeepSeekChatbot:
+    """
+    Create a chatbot from the token in the environment, exiting if none is set.
 
     Returns:
-        The model's response, or None if there was an error
+        An authenticated DeepSeekChatbot instance
     """
     token = get_token_from_env()
 
@@ -38,50 +98,133 @@ def query_deepseek(prompt: str, stream: bool = False) -> Optional[str]:
         print("You can also create a .env file based on env_example")
         sys.exit(1)
 
-    chatbot = DeepSeekChatbot(token)
+    return DeepSeekChatbot(token)
+
+
+def query_deepseek(prompt: str, stream: bool = False) -> Optional[str]:
+    """
+    Send a query to the DeepSeek-V3 model and get a response.
+
+    Args:
+        prompt: The user's prompt or question
+        stream: Whether to stream the response
+
+    Returns:
+        The model's response, or None if there was an error
+    """
+    return asyncio.run(aquery_deepseek(prompt, stream=stream))
+
+
+async def aquery_deepseek(
+    prompt: str, stream: bool = False, chatbot: Optional[DeepSeekChatbot] = None
+) -> Optional[str]:
+    """
+    Asynchronously send a query to the DeepSeek-V3 model and get a response.
+
+    Args:
+        prompt: The user's prompt or question
+        stream: Whether to stream the response
+        chatbot: Chatbot to reuse; if omitted one is created and closed here
+
+    Returns:
+        The model's response, or None if there was an error
+    """
+    owns_chatbot = chatbot is None
+    if chatbot is None:
+        chatbot = create_chatbot()
     messages = [UserMessage(prompt)]
 
     try:
         if stream:
             # Stream response
-            full_response = ""
+            response_parts: List[str] = []
+            printer = StreamPrinter()
             try:
-                for chunk in chatbot.get_response(messages, stream=True):
-                    content = ""
-                    if (
-                        hasattr(chunk, "choices")
-                        and chunk.choices
-                        and hasattr(chunk.choices[0], "delta")
-                        and chunk.choices[0].delta
-                        and hasattr(chunk.choices[0].delta, "content")
-                    ):
-                        content = chunk.choices[0].delta.content or ""
-                        full_response += content
-                        print(content, end="", flush=True)
+                response = await chatbot.aget_response(messages, stream=True)
+                async for content in aiter_deltas(response):
+                    response_parts.append(content)
+                    printer.write(content)
 
+                printer.flush()
                 print()  # Add a newline at the end
-                return full_response
+                return "".join(response_parts)
             except Exception as e:
+                printer.flush()
                 print(f"Error streaming response: {str(e)}")
                 return None
         else:
             # Get complete response
-            response = chatbot.get_response(messages, stream=False)
-            if (
-                response
-                and hasattr(response, "choices")
-                and response.choices
-                and hasattr(response.choices[0], "message")
-                and response.choices[0].message
-                and hasattr(response.choices[0].message, "content")
-            ):
-                content = response.choices[0].message.content
-                # Explicitly convert to str or return None to satisfy mypy
-                return str(content) if content is not None else None
-            return None
+            response = await chatbot.aget_response(messages, stream=False)
+            try:
+                content = response.choices[0].message.content  # type: ignore[union-attr]
+            except (AttributeError, IndexError, TypeError):
+                return None
+            # Explicitly convert to str or return None to satisfy mypy
+            return str(content) if content is not None else None
     except Exception as e:
         print(f"Error communicating with DeepSeek model: {str(e)}")
         sys.exit(1)
+    finally:
+        if owns_chatbot:
+            await chatbot.aclose()
+
+
+def ainput(prompt: str) -> Awaitable[str]:
+    """
+    Read a line from stdin without blocking the event loop.
+
+    The read happens on a daemon thread so a pending prompt never keeps the
+    interpreter alive on exit.
+
+    Args:
+        prompt: The prompt to display
+
+    Returns:
+        An awaitable resolving to the line read (or raising EOFError)
+    """
+    loop = asyncio.get_running_loop()
+    future: "asyncio.Future[str]" = loop.create_future()
+
+    def resolve(result: Optional[str], error: Optional[BaseException]) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(str(result))
+
+    def read() -> None:
+        try:
+            line = input(prompt)
+        except Exception as e:
+            loop.call_soon_threadsafe(resolve, None, e)
+        else:
+            loop.call_soon_threadsafe(resolve, line, None)
+
+    threading.Thread(target=read, daemon=True).start()
+    return future
+
+
+async def interactive_session() -> None:
+    """Run the interactive prompt loop on a single event loop."""
+    print("DeepSeek-V3 Interactive Mode (Type 'exit' to quit)")
+    print("-" * 50)
+
+    chatbot = create_chatbot()
+    try:
+        while True:
+            try:
+                user_input = await ainput("\nYou: ")
+            except EOFError:
+                print("\nExiting...")
+                break
+            if user_input.lower() in ["exit", "quit"]:
+                break
+
+            print("\nDeepSeek: ", end="")
+            await aquery_deepseek(user_input, stream=True, chatbot=chatbot)
+    finally:
+        await chatbot.aclose()
 
 
 def main() -> None:
@@ -96,25 +239,12 @@ def main() -> None:
     args = parser.parse_args()
 
     if args.interactive:
-        print("DeepSeek-V3 Interactive Mode (Type 'exit' to quit)")
-        print("-" * 50)
-
-        while True:
-            try:
-                user_input = input("\nYou: ")
-                if user_input.lower() in ["exit", "quit"]:
-                    break
-
-                print("\nDeepSeek: ", end="")
-                query_deepseek(user_input, stream=True)
-            except KeyboardInterrupt:
-                print("\nExiting...")
-                break
-            except EOFError:
-                print("\nExiting...")
-                break
+        try:
+            asyncio.run(interactive_session())
+        except KeyboardInterrupt:
+            print("\nExiting...")
     elif args.prompt:
-        response = query_deepseek(args.prompt, stream=args.stream)
+        response = asyncio.run(aquery_deepseek(args.prompt, stream=args.stream))
         if not args.stream:
             print(response)
     else:
@@ -5,10 +5,26 @@ This module provides the core functionality for interacting with
 the DeepSeek-V3 language model through Azure AI Inference SDK.
 """
 
-import os
-from typing import List, Optional, Union, Generator
+import functools
+import queue
+import threading
+import time
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    Generator,
+)
 
 from azure.ai.inference import ChatCompletionsClient
+from azure.ai.inference.aio import ChatCompletionsClient as AsyncChatCompletionsClient
 from azure.ai.inference.models import (
     AssistantMessage,
     SystemMessage,
@@ -17,8 +33,139 @@ from azure.ai.inference.models import (
     ChatCompletionsStreamResponse,
 )
 from azure.core.credentials import AzureKeyCredential
+from azure.core.pipeline.transport import AioHttpTransport, RequestsTransport
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from deepseek_chatbot import (  # noqa: F401 - get_token_from_env is re-exported
+    CONNECTION_TIMEOUT,
+    MODEL_NAME,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    READ_TIMEOUT,
+    RESPONSE_CACHE_SIZE,
+    RETRY_TOTAL,
+    STREAM_FLUSH_INTERVAL,
+    STREAM_MAX_HOLD,
+    get_endpoint,
+    get_token_from_env,
+)
+
+
+def _make_session() -> Session:
+    """
+    Create an HTTP session with an explicitly sized, keep-alive connection pool.
+
+    Returns:
+        Session: The configured requests session
+    """
+    session = Session()
+    # Retries are left to the SDK's retry policy
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(total=False, redirect=False, raise_on_status=False),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(endpoint: str, token: str) -> ChatCompletionsClient:
+    """
+    Get a client for the endpoint and token, shared by chatbots that match.
+
+    Args:
+        endpoint (str): URL of the inference endpoint
+        token (str): GitHub token or Azure key for authentication
+
+    Returns:
+        ChatCompletionsClient: The client for this endpoint and token
+    """
+    # One transport per client keeps its connection pool warm across turns
+    return ChatCompletionsClient(
+        endpoint=endpoint,
+        credential=AzureKeyCredential(token),
+        transport=RequestsTransport(
+            session=_make_session(),
+            connection_timeout=CONNECTION_TIMEOUT,
+            read_timeout=READ_TIMEOUT,
+        ),
+        retry_total=RETRY_TOTAL,
+    )
+
 
-from deepseek_chatbot import ENDPOINT, MODEL_NAME
+def _timeout_options(request_timeout: Optional[float]) -> Dict[str, Any]:
+    """
+    Build per-request transport options for an optional read timeout.
+
+    Args:
+        request_timeout: Seconds to wait for data, or None for the default
+
+    Returns:
+        Dict[str, Any]: Keyword arguments to pass to complete()
+    """
+    if request_timeout is None:
+        return {}
+    return {"read_timeout": request_timeout}
+
+
+# Hashable form of a message list: each message as its (key, value) pairs
+_MessagesKey = Tuple[Tuple[Tuple[str, Any], ...], ...]
+
+
+def _messages_key(messages: Iterable[Any]) -> Optional[_MessagesKey]:
+    """
+    Build a cache key for a message list.
+
+    Args:
+        messages: List of message objects or role/content dicts
+
+    Returns:
+        Optional[_MessagesKey]: The key, or None if a message holds
+            unhashable content (images, tool calls) and should not be cached
+    """
+    try:
+        key = tuple(tuple(message.items()) for message in messages)
+        hash(key)
+    except (AttributeError, TypeError):
+        return None
+    return key
+
+
+@functools.lru_cache(maxsize=RESPONSE_CACHE_SIZE)
+def _cached_complete(
+    endpoint: str,
+    token: str,
+    model: str,
+    messages: _MessagesKey,
+    max_tokens: int,
+    request_timeout: Optional[float],
+) -> ChatCompletionsResponse:
+    """
+    Get a complete response, reusing the result of an identical earlier request.
+
+    Args:
+        endpoint: URL of the inference endpoint
+        token: GitHub token or Azure key for authentication
+        model: Name of the model to query
+        messages: Messages as returned by _messages_key()
+        max_tokens: Maximum number of tokens to generate
+        request_timeout: Seconds to wait for data, or None for the default
+
+    Returns:
+        ChatCompletionsResponse: The model's response, shared by every caller
+            that makes the same request
+    """
+    return _get_client(endpoint, token).complete(
+        stream=False,
+        messages=[dict(message) for message in messages],
+        model=model,
+        max_tokens=max_tokens,
+        **_timeout_options(request_timeout),
+    )
 
 
 class DeepSeekChatbot:
@@ -36,17 +183,21 @@ class DeepSeekChatbot:
         Args:
             token (str): GitHub token or Azure key for authentication
         """
-        self.client = ChatCompletionsClient(
-            endpoint=ENDPOINT,
-            credential=AzureKeyCredential(token),
-        )
+        self._token = token
+        self.endpoint = get_endpoint()
+        self.client = _get_client(self.endpoint, token)
+        self.async_client: Optional[AsyncChatCompletionsClient] = None
         self.model_name = MODEL_NAME
 
     def get_response(
         self,
-        messages: List[Union[UserMessage, AssistantMessage, SystemMessage]],
+        messages: Sequence[
+            Union[UserMessage, AssistantMessage, SystemMessage, Dict[str, Any]]
+        ],
         stream: bool = False,
         max_tokens: int = 1000,
+        request_timeout: Optional[float] = None,
+        cache: bool = False,
     ) -> Union[
         ChatCompletionsResponse, Generator[ChatCompletionsStreamResponse, None, None]
     ]:
@@ -54,9 +205,14 @@ class DeepSeekChatbot:
         Get a response from the DeepSeek model based on the provided messages.
 
         Args:
-            messages: List of message objects (UserMessage, AssistantMessage)
+            messages: List of message objects or role/content dicts
             stream: Whether to stream the response or not
             max_tokens: Maximum number of tokens to generate
+            request_timeout: Seconds to wait for data before giving up; defaults
+                to the client's READ_TIMEOUT
+            cache: Reuse the response of an identical earlier non-streaming
+                request instead of sampling the model again; cached responses
+                are shared objects and must not be modified
 
         Returns:
             If stream=False, returns the complete response
@@ -65,21 +221,203 @@ class DeepSeekChatbot:
         Raises:
             Exception: If there's an error communicating with the DeepSeek model
         """
+        if cache and not stream:
+            key = _messages_key(messages)
+            if key is not None:
+                return _cached_complete(
+                    self.endpoint,
+                    self._token,
+                    self.model_name,
+                    key,
+                    max_tokens,
+                    request_timeout,
+                )
         return self.client.complete(
             stream=stream,
             messages=messages,
             model=self.model_name,
             max_tokens=max_tokens,
+            **_timeout_options(request_timeout),
         )
 
+    async def aget_response(
+        self,
+        messages: Sequence[
+            Union[UserMessage, AssistantMessage, SystemMessage, Dict[str, Any]]
+        ],
+        stream: bool = False,
+        max_tokens: int = 1000,
+        request_timeout: Optional[float] = None,
+    ) -> Union[ChatCompletionsResponse, AsyncIterator[ChatCompletionsStreamResponse]]:
+        """
+        Asynchronously get a response from the DeepSeek model.
 
-def get_token_from_env() -> Optional[str]:
+        The async client is created on first use; call aclose() once done.
+
+        Args:
+            messages: List of message objects or role/content dicts
+            stream: Whether to stream the response or not
+            max_tokens: Maximum number of tokens to generate
+            request_timeout: Seconds to wait for data before giving up; defaults
+                to the client's READ_TIMEOUT
+
+        Returns:
+            If stream=False, returns the complete response
+            If stream=True, returns an async stream of response chunks
+
+        Raises:
+            Exception: If there's an error communicating with the DeepSeek model
+        """
+        if self.async_client is None:
+            self.async_client = AsyncChatCompletionsClient(
+                endpoint=self.endpoint,
+                credential=AzureKeyCredential(self._token),
+                transport=AioHttpTransport(
+                    connection_timeout=CONNECTION_TIMEOUT,
+                    read_timeout=READ_TIMEOUT,
+                ),
+                retry_total=RETRY_TOTAL,
+            )
+        return await self.async_client.complete(
+            stream=stream,
+            messages=messages,
+            model=self.model_name,
+            max_tokens=max_tokens,
+            **_timeout_options(request_timeout),
+        )
+
+    async def aclose(self) -> None:
+        """Close the async client, if one was created."""
+        if self.async_client is not None:
+            await self.async_client.close()
+            self.async_client = None
+
+
+def iter_deltas(response: Iterable[Any]) -> Generator[str, None, None]:
     """
-    Get authentication token from environment variables.
+    Yield the text of each chunk in a streamed response.
 
-    Checks for GITHUB_TOKEN or AZURE_KEY environment variables.
+    Chunks without text (role-only, finish and keep-alive chunks) are skipped.
 
-    Returns:
-        Optional[str]: The token if found, None otherwise
+    Args:
+        response: Stream of response chunks from the DeepSeek model
+
+    Yields:
+        str: The non-empty content of each chunk's delta
     """
-    return os.environ.get("GITHUB_TOKEN") or os.environ.get("AZURE_KEY")
+    for chunk in response:
+        try:
+            content = chunk.choices[0].delta.content
+        except (AttributeError, IndexError, TypeError):
+            continue
+        if content:
+            yield content
+
+
+async def aiter_deltas(response: AsyncIterable[Any]) -> AsyncIterator[str]:
+    """
+    Asynchronously yield the text of each chunk in a streamed response.
+
+    Args:
+        response: Async stream of response chunks from the DeepSeek model
+
+    Yields:
+        str: The non-empty content of each chunk's delta
+    """
+    async for chunk in response:
+        try:
+            content = chunk.choices[0].delta.content
+        except (AttributeError, IndexError, TypeError):
+            continue
+        if content:
+            yield content
+
+
+def _read_deltas(
+    response: Iterable[Any],
+    deltas: "queue.Queue[Union[str, Exception, None]]",
+    stop: threading.Event,
+) -> None:
+    """
+    Put the text of each streamed chunk on the queue, ending with None.
+
+    Reading stops at the next chunk once stop is set, and the response is
+    closed either way so its connection goes back to the pool.
+    """
+    try:
+        try:
+            for content in iter_deltas(response):
+                if stop.is_set():
+                    break
+                deltas.put(content)
+        finally:
+            close = getattr(response, "close", None)
+            if close is not None:
+                close()
+    except Exception as e:
+        # Re-raised by token_gen so the caller sees the stream's error
+        deltas.put(e)
+    deltas.put(None)
+
+
+def token_gen(
+    response: Iterable[Any], min_batch_size: int = 1
+) -> Generator[str, None, None]:
+    """
+    Yield the text of a streamed response in batches, e.g. for st.write_stream.
+
+    Deltas are batched so the reply is re-rendered at most once per
+    STREAM_FLUSH_INTERVAL rather than once per token. The response is read on
+    a background thread, so text held back by the interval is shown when the
+    interval ends even if the stream pauses, and text waiting for a batch of
+    min_batch_size deltas is shown after at most STREAM_MAX_HOLD seconds.
+    Closing the generator early stops the reader and closes the response.
+
+    Args:
+        response: Stream of response chunks from the DeepSeek model
+        min_batch_size: Minimum number of deltas to group into one update
+
+    Yields:
+        str: Batches of response text
+    """
+    deltas: "queue.Queue[Union[str, Exception, None]]" = queue.Queue()
+    stop = threading.Event()
+    threading.Thread(
+        target=_read_deltas, args=(response, deltas, stop), daemon=True
+    ).start()
+
+    try:
+        pending: List[str] = []
+        last_flush = held_since = time.monotonic()
+        due: Optional[float] = None
+        while True:
+            timeout = None if due is None else max(0.0, due - time.monotonic())
+            try:
+                item = deltas.get(timeout=timeout)
+            except queue.Empty:
+                pass  # No new delta, but the held text is due
+            else:
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                if not pending:
+                    held_since = time.monotonic()
+                pending.append(item)
+
+            if len(pending) >= min_batch_size:
+                due = last_flush + STREAM_FLUSH_INTERVAL
+            else:
+                due = held_since + STREAM_MAX_HOLD
+            now = time.monotonic()
+            if now >= due:
+                yield "".join(pending)
+                pending = []
+                last_flush = now
+                due = None
+
+        if pending:
+            yield "".join(pending)
+    finally:
+        # Reached on exhaustion, on error, and when the consumer stops early
+        stop.set()
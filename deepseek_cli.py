@@ -8,17 +8,18 @@ DeepSeek-V3 language model through Azure AI Inference SDK.
 import os
 import sys
 import argparse
-from dotenv import load_dotenv
-from azure.ai.inference import ChatCompletionsClient
+import asyncio
+from typing import List, Optional
+from azure.ai.inference.aio import ChatCompletionsClient as AsyncChatCompletionsClient
 from azure.ai.inference.models import UserMessage
 from azure.core.credentials import AzureKeyCredential
 
-# Load environment variables from .env file
-load_dotenv()
+from deepseek_chatbot import MODEL_NAME, get_endpoint, load_env
+from deepseek_chatbot.cli import StreamPrinter, ainput
+from deepseek_chatbot.core import aiter_deltas
 
-# Configuration
-ENDPOINT = "https://models.inference.ai.azure.com"
-MODEL_NAME = "DeepSeek-V3"
+# Load environment variables from .env file
+load_env()
 
 
 def get_credentials() -> str:
@@ -52,66 +53,100 @@ def query_deepseek(prompt: str, stream: bool = False) -> str:
     Returns:
         str: The model's response
     """
-    token = get_credentials()
+    return asyncio.run(aquery_deepseek(prompt, stream=stream))
 
-    client = ChatCompletionsClient(
-        endpoint=ENDPOINT,
-        credential=AzureKeyCredential(token),
-    )
+
+async def aquery_deepseek(
+    prompt: str,
+    stream: bool = False,
+    client: Optional[AsyncChatCompletionsClient] = None,
+) -> str:
+    """
+    Asynchronously send a query to the DeepSeek-V3 model and get a response.
+
+    Args:
+        prompt (str): The user's prompt or question
+        stream (bool): Whether to stream the response
+        client: Async client to reuse; if omitted one is created and closed here
+
+    Returns:
+        str: The model's response
+    """
+    owns_client = client is None
+    if client is None:
+        client = AsyncChatCompletionsClient(
+            endpoint=get_endpoint(),
+            credential=AzureKeyCredential(get_credentials()),
+        )
 
     messages = [UserMessage(prompt)]
 
     try:
         if stream:
             # Stream response
-            full_response = ""
+            response_parts: List[str] = []
+            printer = StreamPrinter()
             try:
-                for chunk in client.complete(
+                response = await client.complete(
                     stream=True,
                     messages=messages,
                     model=MODEL_NAME,
                     max_tokens=1000,
-                ):
-                    content = ""
-                    if (
-                        hasattr(chunk, "choices")
-                        and chunk.choices
-                        and hasattr(chunk.choices[0], "delta")
-                        and chunk.choices[0].delta
-                        and hasattr(chunk.choices[0].delta, "content")
-                    ):
-                        content = chunk.choices[0].delta.content or ""
-                        full_response += content
-                        print(content, end="", flush=True)
+                )
+                async for content in aiter_deltas(response):
+                    response_parts.append(content)
+                    printer.write(content)
 
+                printer.flush()
                 print()  # Add a newline at the end
-                return full_response
+                return "".join(response_parts)
             except Exception as e:
+                printer.flush()
                 print(f"Error streaming response: {str(e)}")
                 return "Error getting response from the model."
         else:
             # Get complete response
-            response = client.complete(
+            response = await client.complete(
                 stream=False,
                 messages=messages,
                 model=MODEL_NAME,
                 max_tokens=1000,
             )
 
-            if (
-                hasattr(response, "choices")
-                and response.choices
-                and hasattr(response.choices[0], "message")
-                and response.choices[0].message
-                and hasattr(response.choices[0].message, "content")
-            ):
-                # Explicitly cast to string to avoid mypy error
+            try:
                 content = response.choices[0].message.content
-                return str(content)
-            return "No response from the model."
+            except (AttributeError, IndexError, TypeError):
+                return "No response from the model."
+            # Explicitly cast to string to avoid mypy error
+            return str(content)
     except Exception as e:
         print(f"Error communicating with DeepSeek model: {str(e)}")
         sys.exit(1)
+    finally:
+        if owns_client:
+            await client.close()
+
+
+async def interactive_session() -> None:
+    """Run the interactive prompt loop on a single event loop."""
+    print("DeepSeek-V3 Interactive Mode (Type 'exit' to quit)")
+    print("-" * 50)
+
+    async with AsyncChatCompletionsClient(
+        endpoint=get_endpoint(),
+        credential=AzureKeyCredential(get_credentials()),
+    ) as client:
+        while True:
+            try:
+                user_input = await ainput("\nYou: ")
+            except EOFError:
+                print("\nExiting...")
+                break
+            if user_input.lower() in ["exit", "quit"]:
+                break
+
+            print("\nDeepSeek: ", end="")
+            await aquery_deepseek(user_input, stream=True, client=client)
 
 
 def main() -> None:
@@ -126,25 +161,12 @@ def main() -> None:
     args = parser.parse_args()
 
     if args.interactive:
-        print("DeepSeek-V3 Interactive Mode (Type 'exit' to quit)")
-        print("-" * 50)
-
-        while True:
-            try:
-                user_input = input("\nYou: ")
-                if user_input.lower() in ["exit", "quit"]:
-                    break
-
-                print("\nDeepSeek: ", end="")
-                query_deepseek(user_input, stream=True)
-            except KeyboardInterrupt:
-                print("\nExiting...")
-                break
-            except EOFError:
-                print("\nExiting...")
-                break
+        try:
+            asyncio.run(interactive_session())
+        except KeyboardInterrupt:
+            print("\nExiting...")
     elif args.prompt:
-        response = query_deepseek(args.prompt, stream=args.stream)
+        response = asyncio.run(aquery_deepseek(args.prompt, stream=args.stream))
         if not args.stream:
             print(response)
     else:
@@ -5,14 +5,60 @@ This script shows how to interact with the DeepSeek-V3 model using the
 DeepSeek Chatbot package without the Streamlit interface.
 """
 
+import asyncio
+import functools
 import sys
-from dotenv import load_dotenv
-from azure.ai.inference.models import UserMessage, SystemMessage
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List
 
-from deepseek_chatbot.core import DeepSeekChatbot, get_token_from_env
+# Only the lightweight package root is imported up front; the Azure SDK is
+# imported in main() once a token is known to exist
+from deepseek_chatbot import get_token_from_env, load_env
+
+if TYPE_CHECKING:
+    from deepseek_chatbot.core import DeepSeekChatbot
 
 # Load environment variables from .env file
-load_dotenv()
+load_env()
+
+# Static system prompt, built once and reused by every request that needs it.
+# The SDK accepts plain dicts as messages, so this needs no SDK import and is
+# sent as-is without a per-request model conversion.
+SYSTEM_GEOGRAPHY: Dict[str, str] = {
+    "role": "system",
+    "content": "You are a helpful assistant specializing in geography.",
+}
+
+
+async def stream_example(chatbot: "DeepSeekChatbot", messages: List[Any]) -> None:
+    """Stream a response over the async client, printing text as it arrives."""
+    from deepseek_chatbot.cli import StreamPrinter
+    from deepseek_chatbot.core import aiter_deltas
+
+    # Writes are coalesced into ~16 ms batches instead of one flush per chunk
+    printer = StreamPrinter()
+    try:
+        response = await chatbot.aget_response(messages, stream=True)
+        # aiohttp keeps reading the socket while the loop prints
+        async for content in aiter_deltas(response):
+            printer.write(content)
+    finally:
+        printer.flush()
+        # The async client must be closed on the loop that created it
+        await chatbot.aclose()
+
+
+def run_nonstream(chatbot: "DeepSeekChatbot", messages: List[Any]) -> str:
+    """Get a complete (non-streaming) response and format it for printing."""
+    # Opt in to the response cache so a repeated question (Example 4) is
+    # answered without sending another request
+    response = chatbot.get_response(messages, cache=True)
+    try:
+        content = response.choices[0].message.content  # type: ignore[union-attr]
+    except (AttributeError, IndexError, TypeError):
+        return "Error: Unable to get response from the model"
+    return f"Response: {content}"
 
 
 def main() -> None:
@@ -28,52 +74,51 @@ def main() -> None:
         print("You can also create a .env file based on env_example")
         sys.exit(1)
 
+    from azure.ai.inference.models import UserMessage
+
+    from deepseek_chatbot.core import DeepSeekChatbot
+
     # Initialize the chatbot
     chatbot = DeepSeekChatbot(token)
 
-    # Example 1: Simple question with a single message
-    print("\n=== Example 1: Simple Question ===\n")
-    messages = [UserMessage("What is the capital of France?")]
-
-    response = chatbot.get_response(messages)
-    if (
-        hasattr(response, "choices")
-        and response.choices
-        and response.choices[0].message
-    ):
-        print("Response:", response.choices[0].message.content)
-    else:
-        print("Error: Unable to get response from the model")
-
-    # Example 2: Using a system message to set context
-    print("\n=== Example 2: With System Message ===\n")
-    messages = [
-        SystemMessage("You are a helpful assistant specializing in geography."),
-        UserMessage("Tell me about the geography of Japan."),
+    # Examples 1 and 2 are independent, so both requests are sent at once
+    examples = [
+        # Example 1: Simple question with a single message
+        ("Example 1: Simple Question", [UserMessage("What is the capital of France?")]),
+        # Example 2: Using a system message to set context
+        (
+            "Example 2: With System Message",
+            [
+                SYSTEM_GEOGRAPHY,
+                UserMessage("Tell me about the geography of Japan."),
+            ],
+        ),
     ]
-
-    response = chatbot.get_response(messages)
-    if (
-        hasattr(response, "choices")
-        and response.choices
-        and response.choices[0].message
-    ):
-        print("Response:", response.choices[0].message.content)
-    else:
-        print("Error: Unable to get response from the model")
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = pool.map(
+            functools.partial(run_nonstream, chatbot),
+            [messages for _, messages in examples],
+        )
+        # map() yields in submission order, so output stays in example order
+        for (title, _), result in zip(examples, results):
+            print(f"\n=== {title} ===\n")
+            print(result)
 
     # Example 3: Streaming response
     print("\n=== Example 3: Streaming Response ===\n")
     messages = [UserMessage("Write a short poem about artificial intelligence.")]
 
     print("Response: ", end="", flush=True)
-    for chunk in chatbot.get_response(messages, stream=True):
-        if hasattr(chunk, "choices") and chunk.choices and chunk.choices[0].delta:
-            content = chunk.choices[0].delta.content or ""
-            print(content, end="", flush=True)
+    asyncio.run(stream_example(chatbot, messages))
 
     print("\n")  # Add a newline at the end
 
+    # Example 4: Asking Example 1's question again hits the response cache
+    print("=== Example 4: Cached Response ===\n")
+    start = time.perf_counter()
+    print(run_nonstream(chatbot, examples[0][1]))
+    print(f"(answered in {time.perf_counter() - start:.3f} s from the cache)")
+
 
 if __name__ == "__main__":
     main()
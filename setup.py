@@ -6,9 +6,11 @@ from setuptools import setup, find_packages
 with open("README.md", encoding="utf-8") as f:
     long_description = f.read()
 
-# Read requirements from requirements.txt
+# Read requirements from requirements.txt, skipping blank and comment lines
 with open("requirements.txt", encoding="utf-8") as f:
-    requirements = f.read().splitlines()
+    requirements = [
+        line.strip() for line in f if line.strip() and not line.strip().startswith("#")
+    ]
 
 setup(
     name="deepseek-chatbot",
@@ -20,7 +22,7 @@ setup(
     author="Your Name",
     author_email="youremail@example.com",
     url="https://github.com/yourusername/deepseek-chatbot",
-    packages=find_packages(),
+    packages=find_packages(include=["deepseek_chatbot", "deepseek_chatbot.*"]),
     install_requires=requirements,
     python_requires=">=3.8",
     classifiers=[
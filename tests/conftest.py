@@ -0,0 +1,27 @@
+"""
+Shared pytest fixtures for the DeepSeek Chatbot tests.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from azure.ai.inference import ChatCompletionsClient
+
+from deepseek_chatbot.core import _cached_complete, _get_client
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _mock_client():
+    """Replace the sync Azure client class once for the whole test session."""
+    with patch("deepseek_chatbot.core.ChatCompletionsClient") as mock_client:
+        yield mock_client
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_client(_mock_client):
+    """Give each test a fresh client mock and empty client and response caches."""
+    _mock_client.reset_mock(side_effect=True)
+    # Spec the instance so misspelled client attributes fail loudly
+    _mock_client.return_value = Mock(spec=ChatCompletionsClient)
+    _get_client.cache_clear()
+    _cached_complete.cache_clear()
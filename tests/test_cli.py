@@ -0,0 +1,91 @@
+"""
+Test module for the command-line helpers of DeepSeek Chatbot.
+
+This module contains tests for the StreamPrinter class.
+"""
+
+import asyncio
+import time
+
+from deepseek_chatbot.cli import (
+    STDOUT_BUFFER_SIZE,
+    STDOUT_FLUSH_INTERVAL,
+    StreamPrinter,
+)
+
+
+class TestStreamPrinter:
+    """Tests for the StreamPrinter class."""
+
+    def test_write_flushes_after_interval(self, capsys):
+        """Test that text is written at once when the interval has passed."""
+        # Arrange
+        printer = StreamPrinter()
+        printer.last_flush = time.monotonic() - STDOUT_FLUSH_INTERVAL
+
+        # Act
+        printer.write("Hello")
+
+        # Assert
+        assert capsys.readouterr().out == "Hello"
+        assert printer.timer is None
+
+    def test_write_flushes_at_buffer_size(self, capsys):
+        """Test that a full buffer is written before the interval ends."""
+        # Arrange
+        printer = StreamPrinter()
+        text = "x" * STDOUT_BUFFER_SIZE
+
+        # Act
+        printer.write(text)
+
+        # Assert
+        assert capsys.readouterr().out == text
+
+    def test_write_flushes_held_text_on_next_write(self, capsys):
+        """Test that held text is written by the next write after the interval."""
+        # Arrange
+        printer = StreamPrinter()
+
+        # Act
+        printer.write("Hello")
+        held = capsys.readouterr().out
+        time.sleep(STDOUT_FLUSH_INTERVAL)
+        printer.write(" world")
+
+        # Assert
+        assert held == ""
+        assert capsys.readouterr().out == "Hello world"
+        assert printer.timer is None
+
+    def test_write_flushes_held_text_on_event_loop(self, capsys):
+        """Test that the trailing flush runs on the event loop when there is one."""
+
+        # Arrange
+        async def stream():
+            printer = StreamPrinter()
+            printer.write("Hello")
+            held = capsys.readouterr().out
+            await asyncio.sleep(STDOUT_FLUSH_INTERVAL * 5)
+            return held
+
+        # Act
+        held = asyncio.run(stream())
+
+        # Assert
+        assert held == ""
+        assert capsys.readouterr().out == "Hello"
+
+    def test_flush_writes_remaining_text(self, capsys):
+        """Test that a final flush writes everything and cancels the timer."""
+        # Arrange
+        printer = StreamPrinter()
+        printer.write("Hello")
+        printer.write(" world")
+
+        # Act
+        printer.flush()
+
+        # Assert
+        assert capsys.readouterr().out == "Hello world"
+        assert printer.timer is None
@@ -4,18 +4,64 @@ Test module for the core functionality of DeepSeek Chatbot.
 This module contains tests for the DeepSeekChatbot class and utility functions.
 """
 
-import os
-from unittest.mock import patch, MagicMock
+import asyncio
+import threading
+import time
+from unittest.mock import patch, AsyncMock, Mock
 
-from deepseek_chatbot.core import DeepSeekChatbot, get_token_from_env
+import pytest
+
+from deepseek_chatbot import ENDPOINT, STREAM_MAX_HOLD
+from deepseek_chatbot.core import (
+    DeepSeekChatbot,
+    aiter_deltas,
+    get_token_from_env,
+    iter_deltas,
+    token_gen,
+)
+from azure.ai.inference.aio import ChatCompletionsClient as AsyncChatCompletionsClient
 from azure.ai.inference.models import UserMessage
 
 
+def _chunk(content):
+    """Build a streamed response chunk carrying the given delta content."""
+    delta = Mock(spec=["content"], content=content)
+    return Mock(spec=["choices"], choices=[Mock(spec=["delta"], delta=delta)])
+
+
+def _paused_stream(pause):
+    """Stream "Hello", stall for the given seconds, then stream " world"."""
+    yield _chunk("Hello")
+    time.sleep(pause)
+    yield _chunk(" world")
+
+
+class _SlowStream:
+    """Stream numbered chunks slowly, recording how many were read."""
+
+    def __init__(self, count, delay):
+        """Set up a stream of count chunks, one every delay seconds."""
+        self.count = count
+        self.delay = delay
+        self.reads = 0
+        self.closed = threading.Event()
+
+    def __iter__(self):
+        """Yield the chunks, sleeping before each one."""
+        for i in range(self.count):
+            time.sleep(self.delay)
+            self.reads += 1
+            yield _chunk(f"{i} ")
+
+    def close(self):
+        """Record that the stream was closed."""
+        self.closed.set()
+
+
 class TestDeepSeekChatbot:
     """Tests for the DeepSeekChatbot class."""
 
-    @patch("deepseek_chatbot.core.ChatCompletionsClient")
-    def test_init(self, mock_client):
+    def test_init(self, _mock_client):
         """Test the initialization of DeepSeekChatbot."""
         # Arrange
         token = "test_token"
@@ -25,16 +71,49 @@ class TestDeepSeekChatbot:
 
         # Assert
         assert chatbot.model_name == "DeepSeek-V3"
-        mock_client.assert_called_once()
+        _mock_client.assert_called_once()
+
+    def test_init_endpoint_override(self, _mock_client, monkeypatch):
+        """Test that DEEPSEEK_ENDPOINT set after import selects the endpoint."""
+        # Arrange
+        monkeypatch.setenv("DEEPSEEK_ENDPOINT", "https://example.test/inference")
+
+        # Act
+        chatbot = DeepSeekChatbot("test_token")
+
+        # Assert
+        assert chatbot.endpoint == "https://example.test/inference"
+        assert _mock_client.call_args.kwargs["endpoint"] == chatbot.endpoint
+
+    def test_init_default_endpoint(self, _mock_client, monkeypatch):
+        """Test that the default endpoint is used when no override is set."""
+        # Arrange
+        monkeypatch.delenv("DEEPSEEK_ENDPOINT", raising=False)
+
+        # Act
+        chatbot = DeepSeekChatbot("test_token")
+
+        # Assert
+        assert chatbot.endpoint == ENDPOINT
+        assert _mock_client.call_args.kwargs["endpoint"] == ENDPOINT
 
-    @patch("deepseek_chatbot.core.ChatCompletionsClient")
-    def test_get_response(self, mock_client):
+    def test_init_reuses_client(self, _mock_client):
+        """Test that chatbots sharing a token share one client."""
+        # Act
+        first = DeepSeekChatbot("test_token")
+        second = DeepSeekChatbot("test_token")
+
+        # Assert
+        assert first.client is second.client
+        _mock_client.assert_called_once()
+
+    def test_get_response(self, _mock_client):
         """Test the get_response method."""
         # Arrange
         token = "test_token"
         messages = [UserMessage("test message")]
-        mock_instance = mock_client.return_value
-        mock_response = MagicMock()
+        mock_instance = _mock_client.return_value
+        mock_response = Mock(spec=["choices"])
         mock_instance.complete.return_value = mock_response
 
         # Act
@@ -47,24 +126,234 @@ class TestDeepSeekChatbot:
             stream=False, messages=messages, model="DeepSeek-V3", max_tokens=1000
         )
 
+    def test_get_response_cached(self, _mock_client):
+        """Test that identical non-streaming requests share one response."""
+        # Arrange
+        mock_instance = _mock_client.return_value
+        chatbot = DeepSeekChatbot("test_token")
+
+        # Act
+        first = chatbot.get_response([UserMessage("test message")], cache=True)
+        second = chatbot.get_response(
+            [{"role": "user", "content": "test message"}], cache=True
+        )
+        chatbot.get_response([UserMessage("test message")], max_tokens=10, cache=True)
+
+        # Assert
+        assert first is second
+        assert mock_instance.complete.call_count == 2
+
+    def test_get_response_not_cached_by_default(self, _mock_client):
+        """Test that repeated requests reach the model unless caching is asked for."""
+        # Arrange
+        messages = [UserMessage("test message")]
+        mock_instance = _mock_client.return_value
+
+        # Act
+        chatbot = DeepSeekChatbot("test_token")
+        chatbot.get_response(messages)
+        chatbot.get_response(messages)
+
+        # Assert
+        assert mock_instance.complete.call_count == 2
+
+    def test_get_response_stream_not_cached(self, _mock_client):
+        """Test that streaming requests always reach the model."""
+        # Arrange
+        messages = [UserMessage("test message")]
+        mock_instance = _mock_client.return_value
+
+        # Act
+        chatbot = DeepSeekChatbot("test_token")
+        chatbot.get_response(messages, stream=True, cache=True)
+        chatbot.get_response(messages, stream=True, cache=True)
+
+        # Assert
+        assert mock_instance.complete.call_count == 2
+
+    def test_get_response_request_timeout(self, _mock_client):
+        """Test that request_timeout is passed through as the read timeout."""
+        # Arrange
+        messages = [UserMessage("test message")]
+        mock_instance = _mock_client.return_value
+
+        # Act
+        chatbot = DeepSeekChatbot("test_token")
+        chatbot.get_response(messages, stream=True, request_timeout=30)
+
+        # Assert
+        mock_instance.complete.assert_called_once_with(
+            stream=True,
+            messages=messages,
+            model="DeepSeek-V3",
+            max_tokens=1000,
+            read_timeout=30,
+        )
+
+    @patch("deepseek_chatbot.core.AsyncChatCompletionsClient")
+    def test_aget_response(self, mock_async_client):
+        """Test the aget_response method."""
+        # Arrange
+        token = "test_token"
+        messages = [UserMessage("test message")]
+        mock_instance = mock_async_client.return_value = Mock(
+            spec=AsyncChatCompletionsClient
+        )
+        mock_response = Mock(spec=["choices"])
+        mock_instance.complete = AsyncMock(return_value=mock_response)
+        mock_instance.close = AsyncMock()
+
+        # Act
+        chatbot = DeepSeekChatbot(token)
+        result = asyncio.run(chatbot.aget_response(messages, stream=True))
+        asyncio.run(chatbot.aclose())
+
+        # Assert
+        assert result == mock_response
+        mock_instance.complete.assert_awaited_once_with(
+            stream=True, messages=messages, model="DeepSeek-V3", max_tokens=1000
+        )
+        mock_instance.close.assert_awaited_once()
+        assert chatbot.async_client is None
+
 
 class TestUtilities:
     """Tests for utility functions."""
 
-    @patch.dict(os.environ, {"GITHUB_TOKEN": "test_github_token"})
-    def test_get_token_from_env_github(self):
+    def test_get_token_from_env_github(self, monkeypatch):
         """Test getting GitHub token from environment variables."""
+        monkeypatch.setenv("GITHUB_TOKEN", "test_github_token")
         token = get_token_from_env()
         assert token == "test_github_token"
 
-    @patch.dict(os.environ, {"AZURE_KEY": "test_azure_key", "GITHUB_TOKEN": ""})
-    def test_get_token_from_env_azure(self):
+    def test_get_token_from_env_azure(self, monkeypatch):
         """Test getting Azure key from environment variables."""
+        monkeypatch.setenv("AZURE_KEY", "test_azure_key")
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
         token = get_token_from_env()
         assert token == "test_azure_key"
 
-    @patch.dict(os.environ, {"GITHUB_TOKEN": "", "AZURE_KEY": ""})
-    def test_get_token_from_env_none(self):
+    def test_get_token_from_env_none(self, monkeypatch):
         """Test getting token when none exists in environment variables."""
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.delenv("AZURE_KEY", raising=False)
         token = get_token_from_env()
         assert token is None
+
+    def test_iter_deltas(self):
+        """Test extracting text from streamed chunks."""
+        # Arrange
+        chunks = [
+            _chunk("Hello"),
+            _chunk(None),
+            Mock(spec=["choices"], choices=[]),
+            _chunk(" world"),
+        ]
+
+        # Act
+        deltas = list(iter_deltas(chunks))
+
+        # Assert
+        assert deltas == ["Hello", " world"]
+
+    def test_aiter_deltas(self):
+        """Test extracting text from an async stream of chunks."""
+
+        # Arrange
+        async def stream():
+            for chunk in [_chunk("Hello"), _chunk(""), _chunk(" world")]:
+                yield chunk
+
+        async def collect():
+            return [delta async for delta in aiter_deltas(stream())]
+
+        # Act
+        deltas = asyncio.run(collect())
+
+        # Assert
+        assert deltas == ["Hello", " world"]
+
+
+class TestTokenGen:
+    """Tests for the token_gen function."""
+
+    def test_token_gen_yields_all_text(self):
+        """Test that every delta ends up in the yielded batches."""
+        # Arrange
+        chunks = [_chunk("Hello"), _chunk(None), _chunk(" wor"), _chunk("ld")]
+
+        # Act
+        batches = list(token_gen(chunks))
+
+        # Assert
+        assert "".join(batches) == "Hello world"
+
+    def test_token_gen_flushes_held_text_during_pause(self):
+        """Test that received text is shown while the stream is stalled."""
+        # Arrange
+        start = time.monotonic()
+        batches = token_gen(_paused_stream(pause=1.0))
+
+        # Act
+        first = next(batches)
+        elapsed = time.monotonic() - start
+        rest = list(batches)
+
+        # Assert
+        assert first == "Hello"
+        assert elapsed < 0.5
+        assert rest == [" world"]
+
+    def test_token_gen_caps_hold_for_partial_batch(self):
+        """Test that a batch that never fills is shown after STREAM_MAX_HOLD."""
+        # Arrange
+        start = time.monotonic()
+        batches = token_gen(_paused_stream(pause=1.0), min_batch_size=10)
+
+        # Act
+        first = next(batches)
+        elapsed = time.monotonic() - start
+        list(batches)
+
+        # Assert
+        assert first == "Hello"
+        assert STREAM_MAX_HOLD <= elapsed < 1.0
+
+    def test_token_gen_reraises_stream_error(self):
+        """Test that an error reading the stream reaches the caller."""
+
+        # Arrange
+        def failing_stream():
+            yield _chunk("Hello")
+            raise RuntimeError("connection reset")
+
+        # Act / Assert
+        with pytest.raises(RuntimeError, match="connection reset"):
+            list(token_gen(failing_stream()))
+
+    def test_token_gen_stops_reading_when_closed_early(self):
+        """Test that abandoning the generator stops the reader and closes the stream."""
+        # Arrange
+        stream = _SlowStream(count=40, delay=0.01)
+        batches = token_gen(stream)
+
+        # Act
+        next(batches)
+        batches.close()
+        closed = stream.closed.wait(timeout=1)
+
+        # Assert
+        assert closed
+        assert stream.reads < 40
+
+    def test_token_gen_closes_finished_stream(self):
+        """Test that the stream is closed once it has been read to the end."""
+        # Arrange
+        stream = _SlowStream(count=3, delay=0)
+
+        # Act
+        text = "".join(token_gen(stream))
+
+        # Assert
+        assert text == "0 1 2 "
+        assert stream.closed.wait(timeout=1)